@@ -2,11 +2,16 @@
 from __future__ import annotations
 
 import argparse
+import cProfile
 import csv
+import json
 import os
 import re
+import time
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 
 # ============================================================
@@ -103,13 +108,97 @@ def join_ports(lines: List[str]) -> str:
     return "\n".join(out)
 
 
+# ============================================================
+# Performance counters (optional, busif-side)
+# - counters live in reg_busif, read back through reg_core
+# - mapped as consecutive read-only words from a base offset
+# ============================================================
+PERF_COUNTERS: Tuple[Tuple[str, str], ...] = (
+    ("WR_CNT", "Completed write transactions"),
+    ("RD_CNT", "Completed read transactions"),
+    ("SLVERR_CNT", "SLVERR responses (read + write)"),
+    ("B_LAT_MAX", "Max cycles BVALID waited for BREADY"),
+    ("B_LAT_ACC", "Accumulated cycles BVALID waited for BREADY"),
+    ("R_LAT_MAX", "Max cycles RVALID waited for RREADY"),
+    ("R_LAT_ACC", "Accumulated cycles RVALID waited for RREADY"),
+)
+
+
+def perf_token(name: str) -> str:
+    return f"PERF_{name}"
+
+
+def perf_port(name: str) -> str:
+    return f"perf_{name.lower()}"
+
+
+def check_perf_offset(regs: List[Reg], perf_offset: int) -> None:
+    """
+    Performance counter window must be aligned and must not collide
+    with any CSV register (by address or by name).
+    """
+    if perf_offset % 4 != 0:
+        raise ValueError(f"Perf counter offset not 4-byte aligned: 0x{perf_offset:X}")
+    end = perf_offset + 4 * len(PERF_COUNTERS)
+    for rg in regs:
+        if perf_offset <= rg.offset < end:
+            raise ValueError(
+                f"Perf counter window 0x{perf_offset:X}-0x{end - 1:X} overlaps reg '{rg.name}' @0x{rg.offset:X}"
+            )
+        token = reg_token_from_csv(rg.name)
+        if token in {perf_token(n) for n, _ in PERF_COUNTERS}:
+            raise ValueError(f"Register name '{rg.name}' collides with perf counter name")
+
+
+# ============================================================
+# Low-power write options (optional, core-side)
+# - writable regs grouped into banks; each bank is clocked by its own
+#   gated clock (gclk_*) from an ICG driven by the bank write enable (cg_en_*)
+# - data-only regs may use async reset or no reset
+# ============================================================
+WRITABLE_ACCESS = ("RW", "WO", "W1C")
+RESET_STYLES = ("sync", "async", "none")
+
+
+def assign_cg_banks(regs: List[Reg], bank_size: int) -> List[List[str]]:
+    """
+    Group writable register tokens into banks of bank_size regs
+    in offset order. Empty when bank_size <= 0 (banking disabled).
+    """
+    if bank_size <= 0:
+        return []
+    writable = [reg_token_from_csv(rg.name) for rg in regs if rg.access in WRITABLE_ACCESS]
+    return [writable[i:i + bank_size] for i in range(0, len(writable), bank_size)]
+
+
+def resolve_data_regs(regs: List[Reg], names: List[str]) -> Set[str]:
+    """
+    Data-only register tokens: all WO regs plus the named ones.
+    Named regs must exist and be writable (a RO reg without reset never gets a value).
+    """
+    by_token = {reg_token_from_csv(rg.name): rg for rg in regs}
+    tokens = {t for t, rg in by_token.items() if rg.access == "WO"}
+    for n in names:
+        t = reg_token_from_csv(n)
+        rg = by_token.get(t)
+        if rg is None:
+            raise ValueError(f"Data-only register not found: '{n}'")
+        if rg.access not in WRITABLE_ACCESS:
+            raise ValueError(f"Data-only register must be writable: '{n}' [{rg.access}]")
+        tokens.add(t)
+    return tokens
+
+
 # ============================================================
 # CSV parsing
 # ============================================================
 REQUIRED_COLS = ("name", "offset", "access", "reset", "field", "lsb", "msb", "desc")
 
 
-def load_regs(csv_path: str) -> List[Reg]:
+def read_csv_groups(csv_path: str) -> Dict[Tuple[str, int], List[dict]]:
+    """
+    Read CSV rows and group them by (register name, offset).
+    """
     with open(csv_path, "r", encoding="utf-8-sig", newline="") as f:
         r = csv.DictReader(f)
         fns = r.fieldnames or []
@@ -124,9 +213,21 @@ def load_regs(csv_path: str) -> List[Reg]:
                 continue
             off = parse_int(row["offset"])
             groups.setdefault((name, off), []).append(row)
+    return groups
 
+
+def build_regs(groups: Dict[Tuple[str, int], List[dict]]) -> List[Reg]:
+    """
+    Validate grouped CSV rows and build Reg/Field objects (sorted by offset).
+    """
     regs: List[Reg] = []
+    tokens: Dict[str, int] = {}
     for (name, off), rows in sorted(groups.items(), key=lambda x: x[0][1]):
+        token = reg_token_from_csv(name)
+        if token in tokens:
+            raise ValueError(f"Duplicate register name '{name}' ({token}) @0x{off:X}, already used @0x{tokens[token]:X}")
+        tokens[token] = off
+
         accs = {norm_access(rr["access"]) for rr in rows}
         if len(accs) != 1:
             raise ValueError(f"Access mismatch in reg '{name}' @0x{off:X}: {sorted(accs)}")
@@ -157,16 +258,308 @@ def load_regs(csv_path: str) -> List[Reg]:
     return regs
 
 
+def load_regs(csv_path: str) -> List[Reg]:
+    return build_regs(read_csv_groups(csv_path))
+
+
+# ============================================================
+# IP-XACT parsing (IEEE 1685, streaming)
+# - any schema namespace (spirit 1.x / 2009, ipxact 2014 / 2022)
+# - emits the same grouped rows as read_csv_groups
+# - elements are dropped as soon as they are consumed
+# ============================================================
+_IPXACT_INT_RE = re.compile(r"^(?:\d*'([hHdDbBoO]))?([0-9a-fA-FxX_#]+)([kKmMgG]?)$")
+
+_IPXACT_ACCESS = {
+    "read-write": "RW",
+    "read-only": "RO",
+    "write-only": "WO",
+}
+
+
+def parse_ipxact_int(s: str) -> int:
+    """
+    Accepts decimal, 0x/#-prefixed hex, SystemVerilog-style ('h1F, 32'h1F)
+    and K/M/G scaled integers.
+    """
+    t = (s or "").strip()
+    m = _IPXACT_INT_RE.match(t)
+    if not m:
+        raise ValueError(f"Invalid IP-XACT integer: '{s}'")
+    base_ch, digits, scale = m.groups()
+    digits = digits.replace("_", "")
+    try:
+        if base_ch:
+            v = int(digits, {"h": 16, "d": 10, "b": 2, "o": 8}[base_ch.lower()])
+        elif digits.startswith("#"):
+            v = int(digits[1:], 16)
+        elif digits[:2].lower() in ("0x", "0b"):
+            v = int(digits, 0)
+        else:
+            # Plain decimal; leading zeros (e.g. '08') are allowed
+            v = int(digits, 10)
+    except ValueError:
+        raise ValueError(f"Invalid IP-XACT integer: '{s}'") from None
+    return v << {"": 0, "k": 10, "m": 20, "g": 30}[scale.lower()]
+
+
+# Schema namespaces (SPIRIT 1.x / 2009 and IP-XACT 2014 / 2022); anything else is vendor content
+_IPXACT_NS_PREFIXES = (
+    "http://www.spiritconsortium.org/XMLSchema/SPIRIT/",
+    "http://www.accellera.org/XMLSchema/SPIRIT/",
+    "http://www.accellera.org/XMLSchema/IPXACT/",
+)
+
+
+def _local(tag: str) -> str:
+    """
+    Local name of an IP-XACT schema element, or '' for foreign (vendor) elements.
+    """
+    if tag.startswith("{"):
+        ns, name = tag[1:].split("}", 1)
+        return name if ns.startswith(_IPXACT_NS_PREFIXES) else ""
+    return tag
+
+
+def _ipxact_int(s: str, what: str, where: str) -> int:
+    if not (s or "").strip():
+        raise ValueError(f"Missing {what} in {where}")
+    try:
+        return parse_ipxact_int(s)
+    except ValueError as e:
+        raise ValueError(f"{e} ({what} in {where})") from None
+
+
+def _ipxact_access(access: str, modified_write: str, where: str, read_action: str = "") -> str:
+    if read_action:
+        raise ValueError(f"Unsupported readAction '{read_action}' in {where}")
+    if modified_write == "oneToClear":
+        return "W1C"
+    if modified_write not in ("", "modify"):
+        raise ValueError(f"Unsupported modifiedWriteValue '{modified_write}' in {where}")
+    a = _IPXACT_ACCESS.get(access or "read-write")
+    if a is None:
+        raise ValueError(f"Unsupported access '{access}' in {where}")
+    return a
+
+
+def read_ipxact_groups(xml_path: str) -> Dict[Tuple[str, int], List[dict]]:
+    """
+    Stream an IP-XACT component and group its registers like read_csv_groups.
+    Register offset = addressBlock baseAddress + register addressOffset.
+    Field-level resets (2014+) are merged into the register reset value.
+    Foreign-namespace elements and vendorExtensions are ignored.
+    """
+    groups: Dict[Tuple[str, int], List[dict]] = {}
+    seen: Dict[str, str] = {}  # register token -> first location (one flat reg_core namespace)
+    stack: List[ET.Element] = []
+    path: List[str] = []
+
+    block: Dict[str, str] = {}
+    reg: Dict[str, str] = {}
+    reg_fields: List[Dict[str, str]] = []
+    fld: Dict[str, str] = {}
+
+    for ev, el in ET.iterparse(xml_path, events=("start", "end")):
+        tag = _local(el.tag)
+        if ev == "start":
+            if "vendorExtensions" not in path:
+                if tag in ("registerFile", "alternateRegisters") or (tag == "dim" and path[-1:] == ["register"]):
+                    raise ValueError(f"IP-XACT <{tag}> is not supported: {xml_path}")
+                if tag == "addressBlock":
+                    block = {}
+                elif tag == "register":
+                    reg = {}
+                    reg_fields = []
+                elif tag == "field" and path[-1:] == ["register"]:
+                    fld = {}
+            stack.append(el)
+            path.append(tag)
+            continue
+
+        stack.pop()
+        path.pop()
+        text = (el.text or "").strip()
+        tail = path[-3:]
+
+        if not tag or "vendorExtensions" in path:
+            pass
+        elif "field" in path and "register" in path:
+            # Inside a field: name/description/bit range/access/reset
+            if tail[-1:] == ["field"]:
+                fld[tag] = text
+            elif tag == "value" and tail == ["field", "resets", "reset"]:
+                fld["reset_value"] = text
+            elif tag in ("access", "modifiedWriteValue", "readAction") and tail[-2:] == ["fieldAccessPolicies", "fieldAccessPolicy"]:
+                fld[tag] = text
+        elif tag == "field" and tail[-1:] == ["register"]:
+            reg_fields.append(fld)
+        elif "register" in path:
+            if tail[-1:] == ["register"]:
+                reg[tag] = text
+            elif tag == "value" and tail[-2:] == ["register", "reset"]:
+                reg["reset_value"] = text
+            elif tag == "access" and tail == ["register", "accessPolicies", "accessPolicy"]:
+                reg[tag] = text
+        elif tag == "register" and tail[-1:] == ["addressBlock"]:
+            name = reg.get("name", "")
+            where = f"register '{name}'"
+            bwhere = f"addressBlock '{block.get('name', '')}'"
+            off = (_ipxact_int(block.get("baseAddress", "0"), "baseAddress", bwhere)
+                   + _ipxact_int(reg.get("addressOffset", ""), "addressOffset", where))
+            token = reg_token_from_csv(name)
+            loc = f"{bwhere} @0x{off:X}"
+            if token in seen:
+                raise ValueError(f"Duplicate register name '{name}' ({token}) in {loc}, already defined in {seen[token]}")
+            seen[token] = loc
+            size = _ipxact_int(reg.get("size", ""), "size", where)
+            if size != 32:
+                raise ValueError(f"Unsupported size {size} in {where} (only 32-bit registers)")
+            reg_access = reg.get("access") or block.get("access", "")
+            reset = _ipxact_int(reg["reset_value"], "reset value", where) if "reset_value" in reg else 0
+
+            rows: List[dict] = []
+            for fd in reg_fields:
+                fwhere = f"field '{fd.get('name', '')}' of {where}"
+                lsb = _ipxact_int(fd.get("bitOffset", ""), "bitOffset", fwhere)
+                width = _ipxact_int(fd.get("bitWidth", ""), "bitWidth", fwhere)
+                if lsb + width > 32:
+                    raise ValueError(f"Bit range [{lsb + width - 1}:{lsb}] exceeds 32 bits in {fwhere}")
+                if "reset_value" in fd:
+                    reset |= (_ipxact_int(fd["reset_value"], "reset value", fwhere) & ((1 << width) - 1)) << lsb
+                rows.append({
+                    "field": fd.get("name", ""),
+                    "lsb": str(lsb),
+                    "msb": str(lsb + width - 1),
+                    "desc": fd.get("description", ""),
+                    "access": _ipxact_access(fd.get("access") or reg_access,
+                                             fd.get("modifiedWriteValue", ""), fwhere,
+                                             fd.get("readAction", "")),
+                })
+            if not rows:
+                rows.append({"field": "", "lsb": "", "msb": "", "desc": "",
+                             "access": _ipxact_access(reg_access, "", where)})
+            for rr in rows:
+                rr.update(name=name, offset=str(off), reset=str(reset))
+            groups.setdefault((name, off), []).extend(rows)
+        elif tail[-1:] == ["addressBlock"]:
+            block[tag] = text
+
+        # Everything needed from this element has been copied out
+        el.clear()
+        if stack:
+            stack[-1].remove(el)
+
+    return groups
+
+
+def load_regs_ipxact(xml_path: str) -> List[Reg]:
+    return build_regs(read_ipxact_groups(xml_path))
+
+
 # ============================================================
 # Verilog generation: reg_busif (template)
 # ============================================================
-def gen_busif_v(mod_busif: str) -> str:
+def gen_busif_perf_v() -> str:
+    """
+    Optional transaction / handshake-latency counters.
+    Latency = cycles a response (BVALID/RVALID) is held waiting for READY.
+    Counters wrap at AXI_DATA_W bits.
+    """
+    regs_decl = [f"    reg [AXI_DATA_W-1:0]    {perf_port(n)}_r;" for n, _ in PERF_COUNTERS]
+    assigns = [f"    assign {perf_port(n)} = {perf_port(n)}_r;" for n, _ in PERF_COUNTERS]
+    return f"""
+    // ----------------------------
+    // Performance counters
+    // ----------------------------
+{os.linesep.join(regs_decl)}
+    reg [AXI_DATA_W-1:0]    b_lat_cur;
+    reg [AXI_DATA_W-1:0]    r_lat_cur;
+
+{os.linesep.join(assigns)}
+
+    wire wr_err;
+    wire rd_err;
+
+    assign wr_err = do_write & ~wr_hit;
+    assign rd_err = do_read  & ~rd_hit;
+
+    // Transaction counters
+    always @(posedge clk) begin
+        if (!reset_n) begin
+            perf_wr_cnt_r     <= {{AXI_DATA_W{{1'b0}}}};
+            perf_rd_cnt_r     <= {{AXI_DATA_W{{1'b0}}}};
+            perf_slverr_cnt_r <= {{AXI_DATA_W{{1'b0}}}};
+        end else begin
+            if (do_write) begin
+                perf_wr_cnt_r <= perf_wr_cnt_r + 1'b1;
+            end
+            if (do_read) begin
+                perf_rd_cnt_r <= perf_rd_cnt_r + 1'b1;
+            end
+            if (wr_err || rd_err) begin
+                perf_slverr_cnt_r <= perf_slverr_cnt_r + wr_err + rd_err;
+            end
+        end
+    end
+
+    // Write response latency (BVALID && !BREADY cycles)
+    always @(posedge clk) begin
+        if (!reset_n) begin
+            b_lat_cur         <= {{AXI_DATA_W{{1'b0}}}};
+            perf_b_lat_max_r  <= {{AXI_DATA_W{{1'b0}}}};
+            perf_b_lat_acc_r  <= {{AXI_DATA_W{{1'b0}}}};
+        end else begin
+            if (bvalid_i && s_axi_bready) begin
+                b_lat_cur        <= {{AXI_DATA_W{{1'b0}}}};
+                perf_b_lat_acc_r <= perf_b_lat_acc_r + b_lat_cur;
+                if (b_lat_cur > perf_b_lat_max_r) begin
+                    perf_b_lat_max_r <= b_lat_cur;
+                end
+            end else if (bvalid_i) begin
+                b_lat_cur <= b_lat_cur + 1'b1;
+            end
+        end
+    end
+
+    // Read response latency (RVALID && !RREADY cycles)
+    always @(posedge clk) begin
+        if (!reset_n) begin
+            r_lat_cur         <= {{AXI_DATA_W{{1'b0}}}};
+            perf_r_lat_max_r  <= {{AXI_DATA_W{{1'b0}}}};
+            perf_r_lat_acc_r  <= {{AXI_DATA_W{{1'b0}}}};
+        end else begin
+            if (rvalid_i && s_axi_rready) begin
+                r_lat_cur        <= {{AXI_DATA_W{{1'b0}}}};
+                perf_r_lat_acc_r <= perf_r_lat_acc_r + r_lat_cur;
+                if (r_lat_cur > perf_r_lat_max_r) begin
+                    perf_r_lat_max_r <= r_lat_cur;
+                end
+            end else if (rvalid_i) begin
+                r_lat_cur <= r_lat_cur + 1'b1;
+            end
+        end
+    end
+"""
+
+
+def gen_busif_v(mod_busif: str, perf: bool = False) -> str:
     m = verilog_ident(mod_busif)
+
+    perf_ports = ""
+    perf_logic = ""
+    perf_note = ""
+    if perf:
+        lines = [f"    output wire [AXI_DATA_W-1:0]    {perf_port(n)}" for n, _ in PERF_COUNTERS]
+        perf_ports = ",\n\n    // Performance counters (read back via core)\n" + join_ports(lines)
+        perf_logic = gen_busif_perf_v()
+        perf_note = "\n// - Performance counters: transactions, SLVERR, response handshake latency"
+
     return f"""// Auto-generated: AXI4-Lite bus interface (template)
 // Module: {m}
 // - Single outstanding read/write
 // - AW and W may arrive independently; write occurs when both captured
-// - Uses core-side hit flags to generate SLVERR on undefined address
+// - Uses core-side hit flags to generate SLVERR on undefined address{perf_note}
 // - Verilog-2001
 
 module {m} #(
@@ -209,7 +602,7 @@ module {m} #(
     output wire                     rd_en,
     output wire [AXI_ADDR_W-1:0]    rd_addr,
     input  wire [AXI_DATA_W-1:0]    rd_data,
-    input  wire                     rd_hit
+    input  wire                     rd_hit{perf_ports}
 );
 
     // ----------------------------
@@ -366,7 +759,7 @@ module {m} #(
             end
         end
     end
-
+{perf_logic}
 endmodule
 """
 
@@ -378,8 +771,81 @@ endmodule
 # - external reference outputs: w_REG_***_o
 # - internal regs: r_REG_***
 # ============================================================
-def gen_core_v(mod_core: str, regs: List[Reg]) -> str:
+def gen_write_block_lp(token: str, acc: str, reset: str, bank: Optional[int], reset_style: str) -> str:
+    """
+    Write block for a writable register with clock-gating bank and/or
+    non-default reset style. Still one always block per register.
+    """
+    if acc == "W1C":
+        upd = f"r_{token} & ~(wr_data & wr_mask)"
+    else:
+        upd = f"(r_{token} & ~wr_mask) | (wr_data & wr_mask)"
+
+    tags = [acc]
+    if bank is not None:
+        tags.append(f"bank {bank}")
+    if reset_style == "async":
+        tags.append("async reset")
+    elif reset_style == "none":
+        tags.append("no reset")
+
+    # Banked regs run on the bank gated clock, which only ticks on a bank
+    # write (or during reset), so the address match alone selects the reg
+    # (no-reset regs keep wr_en: the gate is also open during reset)
+    if bank is not None:
+        clk = f"gclk_{bank}"
+        en = f"wr_addr == ADDR_{token}" if reset_style != "none" else f"wr_en && (wr_addr == ADDR_{token})"
+    else:
+        clk = "clk"
+        en = f"wr_en && (wr_addr == ADDR_{token})"
+
+    sens = f"posedge {clk} or negedge reset_n" if reset_style == "async" else f"posedge {clk}"
+    lines = [f"    // {token} ({', '.join(tags)})", f"    always @({sens}) begin"]
+    if reset_style == "none":
+        lines.append(f"        if ({en}) begin")
+    else:
+        lines += [
+            "        if (!reset_n) begin",
+            f"            r_{token} <= {reset};",
+            f"        end else if ({en}) begin",
+        ]
+    lines += [f"            r_{token} <= {upd};", "        end", "    end", ""]
+    return "\n".join(lines)
+
+
+def gen_icg_v(mod_icg: str) -> str:
+    return f"""
+// Behavioural clock gate (latch + AND) used by {mod_icg.rsplit('_icg', 1)[0]}.
+// Replace the body with the technology ICG cell for ASIC/FPGA flows.
+module {mod_icg} (
+    input  wire clk,
+    input  wire en,
+    output wire gclk
+);
+
+    reg en_lat;
+
+    // Transparent while clk is low: no glitches on gclk
+    always @(clk or en) begin
+        if (!clk) begin
+            en_lat <= en;
+        end
+    end
+
+    assign gclk = clk & en_lat;
+
+endmodule
+"""
+
+
+def gen_core_v(mod_core: str, regs: List[Reg], perf_offset: Optional[int] = None,
+               cg_banks: Optional[List[List[str]]] = None, data_reset: str = "sync",
+               data_regs: Optional[Set[str]] = None) -> str:
     m = verilog_ident(mod_core)
+    perf = perf_offset is not None
+    cg_banks = cg_banks or []
+    banks = {t: b for b, members in enumerate(cg_banks) for t in members}
+    data_regs = data_regs or set()
 
     # Comments (fields)
     field_comments: List[str] = []
@@ -390,12 +856,19 @@ def gen_core_v(mod_core: str, regs: List[Reg]) -> str:
             rng = f"[{f.msb}:{f.lsb}]" if f.msb != f.lsb else f"[{f.lsb}]"
             d = f.desc.replace("\n", " ").strip()
             field_comments.append(f"    //   - {f.name}{rng}: {d}")
+    if perf:
+        for i, (n, d) in enumerate(PERF_COUNTERS):
+            off = perf_offset + 4 * i
+            field_comments.append(f"    // {perf_token(n)} @0x{off:04X} [RO] (busif counter): {d}")
 
     # Address localparams
     addr_lines: List[str] = []
     for rg in regs:
         token = reg_token_from_csv(rg.name)
         addr_lines.append(f"    localparam [AXI_ADDR_W-1:0] ADDR_{token} = {rg.offset};")
+    if perf:
+        for i, (n, _) in enumerate(PERF_COUNTERS):
+            addr_lines.append(f"    localparam [AXI_ADDR_W-1:0] ADDR_{perf_token(n)} = {perf_offset + 4 * i};")
 
     # Reg declarations (internal)
     reg_decl: List[str] = []
@@ -415,14 +888,31 @@ def gen_core_v(mod_core: str, regs: List[Reg]) -> str:
         token = reg_token_from_csv(rg.name)
         out_assigns.append(f"    assign w_{token}_o = r_{token};")
 
+    # Clock-gating banks: bank write enable -> ICG -> bank gated clock
+    # (enable is forced during reset so sync-reset flops still see clock edges)
+    cg_lines: List[str] = []
+    n_banks = len(cg_banks)
+    for b, members in enumerate(cg_banks):
+        hits = " | ".join(f"(wr_addr == ADDR_{t})" for t in members)
+        cg_lines += [
+            f"    wire cg_en_{b};",
+            f"    wire gclk_{b};",
+            f"    assign cg_en_{b} = wr_en & ({hits});",
+            f"    {m}_icg u_icg_{b} (.clk(clk), .en(cg_en_{b} | ~reset_n), .gclk(gclk_{b}));",
+            "",
+        ]
+
     # Write always blocks (one always per register, no case)
     write_blocks: List[str] = []
     for rg in regs:
         token = reg_token_from_csv(rg.name)
         acc = rg.access
         reset = fmt_hex32(rg.reset)
+        reset_style = data_reset if token in data_regs else "sync"
 
-        if acc == "RO":
+        if acc in WRITABLE_ACCESS and (token in banks or reset_style != "sync"):
+            blk = gen_write_block_lp(token, acc, reset, banks.get(token), reset_style)
+        elif acc == "RO":
             blk = f"""    // {token} (RO)
     always @(posedge clk) begin
         if (!reset_n) begin
@@ -484,6 +974,14 @@ def gen_core_v(mod_core: str, regs: List[Reg]) -> str:
         rd_hit_cases.append(f"            ADDR_{token}: rd_hit = 1'b1;\n")
         wr_hit_cases.append(f"            ADDR_{token}: wr_hit = 1'b1;\n")
 
+    # Perf counters: read-only, writes ignored (same as RO regs)
+    if perf:
+        for n, _ in PERF_COUNTERS:
+            token = perf_token(n)
+            read_cases.append(f"            ADDR_{token}: rd_data = {perf_port(n)};\n")
+            rd_hit_cases.append(f"            ADDR_{token}: rd_hit = 1'b1;\n")
+            wr_hit_cases.append(f"            ADDR_{token}: wr_hit = 1'b1;\n")
+
     port_lines = [
         "    input  wire                     clk",
         "    input  wire                     reset_n",
@@ -499,9 +997,22 @@ def gen_core_v(mod_core: str, regs: List[Reg]) -> str:
         "    output reg  [AXI_DATA_W-1:0]    rd_data",
         "    output reg                      rd_hit",
     ]
+    if perf:
+        port_lines += [""] + [f"    input  wire [AXI_DATA_W-1:0]    {perf_port(n)}" for n, _ in PERF_COUNTERS]
     # Add reference outputs at the end of the port list
     port_lines += [""] + out_ports
 
+    cg_note = ""
+    cg_section = ""
+    icg_module = ""
+    if n_banks:
+        cg_note = (f"\n// - Clock gating: {n_banks} bank(s), each clocked by gclk_* from {m}_icg"
+                   f"\n//   (enable cg_en_* = write to any reg in the bank, or reset)")
+        cg_section = f"""
+    // Clock-gating banks
+{os.linesep.join(cg_lines)}"""
+        icg_module = gen_icg_v(f"{m}_icg")
+
     return f"""// Auto-generated: register core (from CSV)
 // Module: {m}
 // Rules:
@@ -509,7 +1020,7 @@ def gen_core_v(mod_core: str, regs: List[Reg]) -> str:
 // - Internal registers: r_REG_*
 // - External reference outputs: w_REG_*_o
 // - WRITE logic: one always block per register (no case)
-// - READ logic: case allowed (combinational)
+// - READ logic: case allowed (combinational){cg_note}
 // - Verilog-2001
 
 module {m} #(
@@ -528,7 +1039,7 @@ module {m} #(
 
     // Reference outputs
 {os.linesep.join(out_assigns)}
-
+{cg_section}
 {os.linesep.join(write_blocks)}
 
     // Read mux (combinational)
@@ -555,17 +1066,29 @@ module {m} #(
     end
 
 endmodule
-"""
+{icg_module}"""
 
 
 # ============================================================
 # Verilog generation: reg_wrap (connect busif + core + expose outputs)
 # ============================================================
-def gen_wrap_v(mod_wrap: str, mod_busif: str, mod_core: str, regs: List[Reg]) -> str:
+def gen_wrap_v(mod_wrap: str, mod_busif: str, mod_core: str, regs: List[Reg], perf: bool = False) -> str:
     mw = verilog_ident(mod_wrap)
     mb = verilog_ident(mod_busif)
     mc = verilog_ident(mod_core)
 
+    # Perf counter nets (busif -> core), empty when disabled
+    perf_wires = ""
+    perf_busif_conns = ""
+    perf_core_conns = ""
+    if perf:
+        perf_wires = "\n" + "\n".join(
+            f"    wire [AXI_DATA_W-1:0]    {perf_port(n)};" for n, _ in PERF_COUNTERS
+        ) + "\n"
+        conns = [f"        .{perf_port(n)}({perf_port(n)})" for n, _ in PERF_COUNTERS]
+        perf_busif_conns = ",\n\n" + join_ports(conns)
+        perf_core_conns = "\n" + join_ports(conns) + ",\n"
+
     # Wrap output ports (same as core reference outputs)
     out_ports: List[str] = []
     for rg in regs:
@@ -629,7 +1152,7 @@ module {mw} #(
     wire [AXI_ADDR_W-1:0]    rd_addr;
     wire [AXI_DATA_W-1:0]    rd_data;
     wire                     rd_hit;
-
+{perf_wires}
     {mb} #(
         .AXI_ADDR_W(AXI_ADDR_W),
         .AXI_DATA_W(AXI_DATA_W)
@@ -668,7 +1191,7 @@ module {mw} #(
         .rd_en(rd_en),
         .rd_addr(rd_addr),
         .rd_data(rd_data),
-        .rd_hit(rd_hit)
+        .rd_hit(rd_hit){perf_busif_conns}
     );
 
     {mc} #(
@@ -688,7 +1211,7 @@ module {mw} #(
         .rd_addr(rd_addr),
         .rd_data(rd_data),
         .rd_hit(rd_hit),
-
+{perf_core_conns}
 {join_ports(out_conns)}
     );
 
@@ -705,14 +1228,94 @@ def write_text(path: str, text: str) -> None:
         f.write(text)
 
 
+# ============================================================
+# Profiling (optional)
+# ============================================================
+@contextmanager
+def timed(times: Dict[str, float], stage: str) -> Iterator[None]:
+    """
+    Accumulate wall-clock seconds spent in a stage into times[stage].
+    """
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        times[stage] = times.get(stage, 0.0) + (time.perf_counter() - t0)
+
+
+def profile_summary(in_path: str, fmt: str, regs: List[Reg], times: Dict[str, float],
+                    out_bytes: Dict[str, int]) -> dict:
+    return {
+        "input": in_path,
+        "format": fmt,
+        "registers": len(regs),
+        "fields": sum(len(rg.fields) for rg in regs),
+        "output_bytes": out_bytes,
+        "total_output_bytes": sum(out_bytes.values()),
+        "stages_ms": {k: round(v * 1000.0, 3) for k, v in times.items()},
+        "total_ms": round(sum(times.values()) * 1000.0, 3),
+    }
+
+
+def print_profile(summary: dict) -> None:
+    print("Profile:")
+    for stage, ms in summary["stages_ms"].items():
+        print(f"    {stage:<10}: {ms:10.3f} ms")
+    print(f"    {'total':<10}: {summary['total_ms']:10.3f} ms")
+    print(f"Fields: {summary['fields']}")
+    print(f"Output bytes: {summary['total_output_bytes']}")
+
+
 def main() -> int:
-    ap = argparse.ArgumentParser(description="Generate reg_wrap/reg_busif/reg_core from CSV.")
-    ap.add_argument("csv", help="Input CSV (reg fields).")
+    ap = argparse.ArgumentParser(description="Generate reg_wrap/reg_busif/reg_core from CSV or IP-XACT.")
+    ap.add_argument("csv", help="Input CSV (reg fields) or IP-XACT component XML.")
+    ap.add_argument("--format", choices=("auto", "csv", "ipxact"), default="auto",
+                    help="Input format (default: auto, .xml/.ipxact -> ipxact, else csv).")
     ap.add_argument("--base", default="regblock", help="Base name for modules/files (e.g. gn_common_test).")
     ap.add_argument("--outdir", default=".", help="Output directory (e.g. src).")
+    ap.add_argument("--perf-counters", action="store_true",
+                    help="Add bus transaction/latency counters as read-only registers.")
+    ap.add_argument("--perf-offset", default="0xF00",
+                    help="Byte offset of the perf counter window (default: 0xF00).")
+    ap.add_argument("--cg-bank-size", type=int, default=0,
+                    help="Group writable regs into clock-gated banks of N regs (0: off).")
+    ap.add_argument("--data-reset", choices=RESET_STYLES, default="sync",
+                    help="Reset style for data-only regs (default: sync).")
+    ap.add_argument("--data-regs", default="",
+                    help="Comma-separated regs treated as data-only in addition to all WO regs.")
+    ap.add_argument("--profile", action="store_true",
+                    help="Print per-stage timing, field count and output size.")
+    ap.add_argument("--profile-json", default=None,
+                    help="Write the profile summary as JSON to this path.")
+    ap.add_argument("--profile-dump", default=None,
+                    help="Write cProfile stats to this path (view with pstats/snakeviz).")
     args = ap.parse_args()
 
-    regs = load_regs(args.csv)
+    prof: Optional[cProfile.Profile] = None
+    if args.profile_dump:
+        prof = cProfile.Profile()
+        prof.enable()
+
+    times: Dict[str, float] = {}
+
+    fmt = args.format
+    if fmt == "auto":
+        fmt = "ipxact" if os.path.splitext(args.csv)[1].lower() in (".xml", ".ipxact") else "csv"
+
+    with timed(times, "parse"):
+        if fmt == "ipxact":
+            groups = read_ipxact_groups(args.csv)
+        else:
+            groups = read_csv_groups(args.csv)
+
+    with timed(times, "validate"):
+        regs = build_regs(groups)
+        perf_offset: Optional[int] = None
+        if args.perf_counters:
+            perf_offset = parse_int(args.perf_offset)
+            check_perf_offset(regs, perf_offset)
+        data_regs = resolve_data_regs(regs, [n for n in args.data_regs.split(",") if n.strip()])
+        cg_banks = assign_cg_banks(regs, args.cg_bank_size)
 
     base_mod = verilog_ident(args.base)
     base_file = file_stem(args.base)
@@ -725,19 +1328,44 @@ def main() -> int:
     fn_busif = os.path.join(args.outdir, f"{base_file}_reg_busif.v")
     fn_core  = os.path.join(args.outdir, f"{base_file}_reg_core.v")
 
-    v_busif = gen_busif_v(mod_busif)
-    v_core  = gen_core_v(mod_core, regs)
-    v_wrap  = gen_wrap_v(mod_wrap, mod_busif, mod_core, regs)
+    with timed(times, "gen_busif"):
+        v_busif = gen_busif_v(mod_busif, perf=args.perf_counters)
+    with timed(times, "gen_core"):
+        v_core  = gen_core_v(mod_core, regs, perf_offset,
+                             cg_banks=cg_banks, data_reset=args.data_reset, data_regs=data_regs)
+    with timed(times, "gen_wrap"):
+        v_wrap  = gen_wrap_v(mod_wrap, mod_busif, mod_core, regs, perf=args.perf_counters)
+
+    with timed(times, "write"):
+        write_text(fn_busif, v_busif)
+        write_text(fn_core, v_core)
+        write_text(fn_wrap, v_wrap)
 
-    write_text(fn_busif, v_busif)
-    write_text(fn_core, v_core)
-    write_text(fn_wrap, v_wrap)
+    if prof is not None:
+        prof.disable()
+        prof.dump_stats(args.profile_dump)
 
     print("Generated:")
     print(f"    {fn_wrap}")
     print(f"    {fn_busif}")
     print(f"    {fn_core}")
     print(f"Registers: {len(regs)}")
+    if perf_offset is not None:
+        print(f"Perf counters: {len(PERF_COUNTERS)} @0x{perf_offset:04X}")
+    if cg_banks:
+        print(f"Clock-gating banks: {len(cg_banks)} "
+              f"({sum(len(b) for b in cg_banks)} writable regs, {args.cg_bank_size} per bank)")
+    if args.data_reset != "sync":
+        print(f"Data-only regs ({args.data_reset} reset): {', '.join(sorted(data_regs)) or '-'}")
+
+    if args.profile or args.profile_json:
+        out_bytes = {fn: len(v.encode("utf-8")) for fn, v in
+                     ((fn_busif, v_busif), (fn_core, v_core), (fn_wrap, v_wrap))}
+        summary = profile_summary(args.csv, fmt, regs, times, out_bytes)
+        if args.profile:
+            print_profile(summary)
+        if args.profile_json:
+            write_text(args.profile_json, json.dumps(summary, indent=2) + "\n")
     return 0
 
 